@@ -1,10 +1,14 @@
 import asyncio
+from collections import OrderedDict
 from enum import Enum
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field, model_validator
 from typing_extensions import Self
 
+# Number of language pairs for which each page collection keeps its candidates, see PageCollection.get_candidates
+CANDIDATES_CACHE_SIZE = 16
+
 
 class WikiPage(BaseModel):
     id: Optional[int] = Field(default=None, description="Unique identifier for the wiki page")
@@ -171,6 +175,10 @@ class PageCollection(BaseModel):
         default=None,
         description="End date of the page collection",
     )
+    # Memoized candidates of the most recently used (source, target) language pairs, see get_candidates
+    _candidates_by_language_pair: OrderedDict = PrivateAttr(default_factory=OrderedDict)
+    # Memoized metadata by target language, see get_metadata
+    _metadata_by_language: Dict[str, PageCollectionMetadata] = PrivateAttr(default_factory=dict)
 
     def __str__(self) -> str:
         return f"{self.name} ({len(self.articles)} articles)"
@@ -185,6 +193,43 @@ class PageCollection(BaseModel):
         for candidates in results:
             self.articles.extend(candidates)
 
+        self._candidates_by_language_pair.clear()
+        self._metadata_by_language.clear()
+
+    def get_candidates(
+        self, source_language: str, target_language: str
+    ) -> List[Tuple[WikiDataArticle, str, Optional[str]]]:
+        """
+        Returns the articles of this collection that exist in the source language, as
+        (article, source title, target title) tuples. The target title is None when the article is missing
+        in the target language. The result is memoized for the CANDIDATES_CACHE_SIZE most recently used language
+        pairs, and must not be mutated.
+
+        Args:
+            source_language (str): The source language code, e.g. "en".
+            target_language (str): The target language code, e.g. "el".
+
+        Returns:
+            List[Tuple[WikiDataArticle, str, Optional[str]]]: The candidate articles, in collection order.
+        """
+        language_pair = (source_language, target_language)
+        candidates = self._candidates_by_language_pair.get(language_pair)
+        if candidates is not None:
+            self._candidates_by_language_pair.move_to_end(language_pair)
+            return candidates
+
+        candidates = []
+        for article in self.articles:
+            source_title = article.langlinks.get(source_language)
+            if source_title:
+                candidates.append((article, source_title, article.langlinks.get(target_language)))
+
+        self._candidates_by_language_pair[language_pair] = candidates
+        if len(self._candidates_by_language_pair) > CANDIDATES_CACHE_SIZE:
+            self._candidates_by_language_pair.popitem(last=False)
+
+        return candidates
+
     @computed_field
     @property
     def cache_key(self) -> str:
@@ -203,13 +248,20 @@ class PageCollection(BaseModel):
         return sum(1 for article in self.articles if any(language in key for key in article.langlinks))
 
     def get_metadata(self, target_language) -> PageCollectionMetadata:
-        return PageCollectionMetadata(
-            name=self.name,
-            description=self.description,
-            end_date=self.end_date,
-            articles_count=self.articles_count,
-            articles_by_language_count={target_language: self.articles_in_language_count(target_language)},
-        )
+        # Counting the articles in the target language scans the whole collection, so the metadata is
+        # memoized per target language. The returned model is shared and must not be mutated.
+        metadata = self._metadata_by_language.get(target_language)
+        if metadata is None:
+            metadata = PageCollectionMetadata(
+                name=self.name,
+                description=self.description,
+                end_date=self.end_date,
+                articles_count=self.articles_count,
+                articles_by_language_count={target_language: self.articles_in_language_count(target_language)},
+            )
+            self._metadata_by_language[target_language] = metadata
+
+        return metadata
 
     def __hash__(self) -> int:
         return hash(self.cache_key)
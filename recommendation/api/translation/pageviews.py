@@ -1,9 +1,20 @@
+import asyncio
 from typing import Dict, List
 
 from recommendation.api.translation.models import TranslationRecommendation
 from recommendation.external_data.fetcher import get, get_formatted_endpoint, set_headers_with_host_header
 from recommendation.utils.configuration import configuration
 
+PAGEVIEWS_QUERY_PARAMS = {
+    "action": "query",
+    "format": "json",
+    "formatversion": 2,
+    "prop": "pageviews",  # description|pageimages if we need more data
+    "pvipdays": 1,
+}
+# Maximum number of titles the MediaWiki API accepts in a single query
+TITLES_BATCH_SIZE = 50
+
 
 async def set_pageview_data(source: str, articles: List[TranslationRecommendation]):
     """
@@ -29,17 +40,23 @@ async def set_pageview_data(source: str, articles: List[TranslationRecommendatio
 async def fetch_pageviews(source, titles) -> Dict[str, int]:
     """
     Get pageview counts for a given list of titles from the Wikipedia API.
+    Titles are queried in concurrent batches of TITLES_BATCH_SIZE, the maximum the API accepts per request.
     """
     endpoint = get_formatted_endpoint(configuration.WIKIPEDIA_API, source)
     headers = set_headers_with_host_header(configuration.WIKIPEDIA_API_HEADER, source)
-    params = {
-        "action": "query",
-        "format": "json",
-        "formatversion": 2,
-        "prop": "pageviews",  # description|pageimages if we need more data
-        "titles": "|".join(titles),
-        "pvipdays": 1,
-    }
+    batches = [titles[i : i + TITLES_BATCH_SIZE] for i in range(0, len(titles), TITLES_BATCH_SIZE)]
+
+    results = await asyncio.gather(*[fetch_pageviews_batch(endpoint, headers, batch) for batch in batches])
+
+    pageviews = {}
+    for result in results:
+        pageviews.update(result)
+
+    return pageviews
+
+
+async def fetch_pageviews_batch(endpoint, headers, titles) -> Dict[str, int]:
+    params = {**PAGEVIEWS_QUERY_PARAMS, "titles": "|".join(titles)}
     try:
         data = await get(api_url=endpoint, params=params, headers=headers)
     except ValueError:
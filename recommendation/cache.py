@@ -1,7 +1,8 @@
 import json
+import time
 import zlib
 from functools import lru_cache
-from typing import List
+from typing import Dict, List
 
 from diskcache import UNKNOWN, Cache, Disk
 
@@ -46,19 +47,59 @@ class JSONDisk(Disk):
 class PageCollectionCache(Cache):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Validated page collections of this process, reused until the cached version changes
+        self._page_collections: List[PageCollection] | None = None
+        self._page_collections_version: int | None = None
+        # The same page collections indexed by their casefolded name, and by their cache key
+        self._page_collections_by_name: Dict[str, List[PageCollection]] = {}
+        self._page_collections_by_cache_key: Dict[str, PageCollection] = {}
 
     def set_page_collections(self, page_collections_list: PageCollectionsList):
         self.set("page_collections", page_collections_list)
+        self.set("page_collections_version", time.time_ns())
 
     def get_page_collections(self) -> List[PageCollection]:
+        version = self.get("page_collections_version")
+        if version is None:
+            # Collections written before versioning existed carry no version. Stamp one before loading,
+            # so the load below is memoized. add() only writes when the key is still missing, so a version
+            # written concurrently by set_page_collections is kept.
+            self.add("page_collections_version", time.time_ns())
+            version = self.get("page_collections_version")
+
+        if version == self._page_collections_version:
+            return self._page_collections
+
         collection: str = self.get("page_collections")
+        page_collections: List[PageCollection] = []
 
         if collection:
             model: PageCollectionsList = PageCollectionsList.model_validate(collection)
-
-            return model.list
-
-        return []
+            page_collections = model.list
+
+        self._page_collections = page_collections
+        self._page_collections_version = version
+        self._page_collections_by_name = {}
+        self._page_collections_by_cache_key = {}
+        for page_collection in page_collections:
+            self._page_collections_by_name.setdefault(page_collection.name.casefold(), []).append(page_collection)
+            self._page_collections_by_cache_key.setdefault(page_collection.cache_key, page_collection)
+
+        return page_collections
+
+    def get_page_collections_by_name(self, name: str) -> List[PageCollection]:
+        """
+        Returns the page collections whose name matches the given name, ignoring case.
+        """
+        self.get_page_collections()
+        return self._page_collections_by_name.get(name.casefold(), [])
+
+    def get_page_collection_by_cache_key(self, cache_key: str) -> PageCollection | None:
+        """
+        Returns the cached page collection with the given cache key, if any.
+        """
+        self.get_page_collections()
+        return self._page_collections_by_cache_key.get(cache_key)
 
 
 class SiteMatrixCache(Cache):
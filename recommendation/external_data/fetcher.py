@@ -8,7 +8,31 @@ from recommendation.utils.logger import log
 
 default_headers = {"user-agent": configuration.USER_AGENT_HEADER}
 
-httpx_client = httpx.AsyncClient(timeout=30.0, limits=httpx.Limits(max_keepalive_connections=5, max_connections=5))
+# The pool is sized to the concurrency limit used when fanning out requests, so concurrent
+# requests are not queued behind a smaller connection pool.
+httpx_client = httpx.AsyncClient(
+    timeout=30.0,
+    limits=httpx.Limits(
+        max_keepalive_connections=configuration.API_CONCURRENCY_LIMIT,
+        max_connections=configuration.API_CONCURRENCY_LIMIT,
+    ),
+)
+
+SITEMATRIX_QUERY_PARAMS = {
+    "action": "sitematrix",
+    "format": "json",
+    "formatversion": "2",
+    "smtype": "language",
+    "smlangprop": "code|site",
+}
+
+INTERWIKI_MAP_QUERY_PARAMS = {
+    "action": "query",
+    "format": "json",
+    "formatversion": "2",
+    "meta": "siteinfo",
+    "siprop": "interwikimap",
+}
 
 
 async def get(api_url: str, params: dict = None, headers: dict = None, fetch_all: bool = False):
@@ -33,7 +57,7 @@ async def get(api_url: str, params: dict = None, headers: dict = None, fetch_all
         encoded_params = urllib.parse.urlencode(queryparams, safe=":+|") if params else ""
 
         url = f"{api_url}?{encoded_params}" if encoded_params else api_url
-        log.debug(f"GET: {url}, {headers}")
+        log.debug("GET: %s, %s", url, headers)
         try:
             # follow_redirects is disabled to avoid proxy bypass.
             # All requests must go through the proxy and have a proper host header.
@@ -64,7 +88,7 @@ async def get(api_url: str, params: dict = None, headers: dict = None, fetch_all
 
 
 async def post(url, data=None, headers: dict = None):
-    log.debug(f"POST: {url}")
+    log.debug("POST: %s", url)
     if headers:
         headers = {**default_headers, **headers}
     else:
@@ -120,16 +144,9 @@ def get_formatted_endpoint(configuration, source=""):
 
 async def get_sitematrix() -> List:
     endpoint, headers = get_endpoint_and_headers("meta")
-    params = {
-        "action": "sitematrix",
-        "format": "json",
-        "formatversion": "2",
-        "smtype": "language",
-        "smlangprop": "code|site",
-    }
 
     try:
-        data = await get(endpoint, params=params, headers=headers)
+        data = await get(endpoint, params=SITEMATRIX_QUERY_PARAMS, headers=headers)
         sitematrix = data["sitematrix"]
         del sitematrix["count"]
         return list(sitematrix.values())
@@ -139,10 +156,9 @@ async def get_sitematrix() -> List:
 
 async def get_interwiki_map() -> List:
     endpoint, headers = get_endpoint_and_headers("meta")
-    params = {"action": "query", "format": "json", "formatversion": "2", "meta": "siteinfo", "siprop": "interwikimap"}
 
     try:
-        data = await get(endpoint, params=params, headers=headers)
+        data = await get(endpoint, params=INTERWIKI_MAP_QUERY_PARAMS, headers=headers)
         return data["query"]["interwikimap"]
     except ValueError:
         return []
@@ -16,6 +16,7 @@ from fastapi.responses import PlainTextResponse, RedirectResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from recommendation.api.translation.translation import router as translation_api_router
+from recommendation.external_data import fetcher
 from recommendation.utils.cache_updater import (
     initialize_interwiki_map_cache,
     initialize_sitematrix_cache,
@@ -64,6 +65,8 @@ async def lifespan(app: FastAPI):
         yield
         cache_updater.cancel()
         log.info("Shutting down the service")
+        # Close the pooled keep-alive connections shared by all upstream API calls
+        await fetcher.httpx_client.aclose()
 
     except Exception as e:
         log.exception(f"An unexpected error occurred in the lifespan context: {e}")
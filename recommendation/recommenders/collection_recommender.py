@@ -41,25 +41,33 @@ class CollectionRecommender(BaseRecommender):
     @staticmethod
     def shuffle_collections(page_collections: List[PageCollection]):
         """
-        Shuffles in place page collections and their articles to randomize the recommendations.
+        Shuffles in place the order of the given page collections to randomize the recommendations.
+        The page collections themselves are shared with other requests and are left untouched.
 
         Args:
             page_collections (List[PageCollection]): A list of page collections.
         """
         random.shuffle(page_collections)
-        for collection in page_collections:
-            random.shuffle(collection.articles)
+
+    def iter_shuffled_candidates(self, page_collection: PageCollection):
+        """
+        Lazily yields the candidate articles of the given page collection for the requested language pair
+        in random order. This is a partial Fisher-Yates shuffle over a copy of the memoized candidates, so
+        only as many swaps are made as candidates are consumed.
+        """
+        candidates = list(page_collection.get_candidates(self.source_language, self.target_language))
+        candidates_count = len(candidates)
+        for i in range(candidates_count):
+            j = random.randrange(i, candidates_count)
+            candidates[i], candidates[j] = candidates[j], candidates[i]
+            yield candidates[i]
 
     def get_recommendations_by_status(self, missing=True):
         page_collection_cache = get_page_collection_cache()
-        page_collections: List[PageCollection] = page_collection_cache.get_page_collections()
-
         if self.collection_name:
-            page_collections = [
-                collection
-                for collection in page_collections
-                if collection.name.casefold() == self.collection_name.casefold()
-            ]
+            page_collections = page_collection_cache.get_page_collections_by_name(self.collection_name)
+        else:
+            page_collections = page_collection_cache.get_page_collections()
 
         active_collections = []
         for page_collection in page_collections:
@@ -73,12 +81,15 @@ class CollectionRecommender(BaseRecommender):
 
         self.shuffle_collections(active_collections)
 
-        # Create iterators for the articles of each page collection, paired with their collection
-        article_iterators = [(iter(collection.articles), collection) for collection in active_collections]
+        # Create iterators for the shuffled candidate articles of each page collection, paired with their collection
+        article_iterators = [
+            (self.iter_shuffled_candidates(collection), collection) for collection in active_collections
+        ]
         # Use cycle to iterate through the iterators in a round-robin fashion
         active_iterators = cycle(article_iterators)
 
         recommendations = []
+        recommended_wikidata_ids = set()
         active_iterator = None
         while article_iterators and len(recommendations) < self.count:
             try:
@@ -89,19 +100,14 @@ class CollectionRecommender(BaseRecommender):
 
                 valid_recommendation_for_collection = None
                 while not valid_recommendation_for_collection:
-                    # Fetch the next article from the current iterator
-                    wikidata_article = next(article_iterator)
-                    candidate_source_article_title = wikidata_article.langlinks.get(self.source_language)
-                    candidate_target_article_title = wikidata_article.langlinks.get(self.target_language)
-                    already_exists = any(
-                        wikidata_article.wikidata_id == recommendation.wikidata_id for recommendation in recommendations
+                    # Fetch the next candidate from the current iterator, all candidates exist in the source language
+                    wikidata_article, candidate_source_article_title, candidate_target_article_title = next(
+                        article_iterator
                     )
-                    if (
-                        candidate_source_article_title
-                        and bool(candidate_target_article_title) != missing
-                        and not already_exists
-                    ):
-                        valid_recommendation_for_collection = TranslationRecommendation(
+                    already_exists = wikidata_article.wikidata_id in recommended_wikidata_ids
+                    if bool(candidate_target_article_title) != missing and not already_exists:
+                        # Skip validation, the fields come from the already validated page collection cache
+                        valid_recommendation_for_collection = TranslationRecommendation.model_construct(
                             title=candidate_source_article_title,
                             wikidata_id=wikidata_article.wikidata_id,
                             langlinks_count=len(wikidata_article.langlinks),
@@ -109,6 +115,7 @@ class CollectionRecommender(BaseRecommender):
                         )
 
                 recommendations.append(valid_recommendation_for_collection)
+                recommended_wikidata_ids.add(valid_recommendation_for_collection.wikidata_id)
 
             except StopIteration:
                 # Remove exhausted iterator
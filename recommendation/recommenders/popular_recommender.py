@@ -12,6 +12,18 @@ from recommendation.utils.logger import log
 from recommendation.utils.recommendation_helper import sort_recommendations
 from recommendation.utils.section_recommendation_helper import get_section_suggestions_for_recommendations
 
+# Static part of the "mostviewed" generator query, only "lllang" varies per request
+MOST_VIEWED_QUERY_PARAMS = {
+    "action": "query",
+    "format": "json",
+    "formatversion": 2,
+    "prop": "langlinks|langlinkscount|pageprops",
+    "lllimit": "max",
+    "generator": "mostviewed",
+    "gpvimlimit": "max",
+    "ppprop": "wikibase_item|disambiguation",
+}
+
 
 class PopularRecommender(BaseRecommender):
     def __init__(self, request_model: TranslationRecommendationRequest):
@@ -24,10 +36,7 @@ class PopularRecommender(BaseRecommender):
         return True
 
     async def recommend(self) -> List[TranslationRecommendation]:
-        recommendations = await self.get_recommendations_by_status(missing=True)
-        recommendations = recommendations[: self.count]
-
-        return recommendations
+        return await self.get_recommendations_by_status(missing=True, limit=self.count)
 
     async def recommend_sections(self) -> List[SectionTranslationRecommendation]:
         recommendations = await self.get_recommendations_by_status(missing=False)
@@ -36,13 +45,14 @@ class PopularRecommender(BaseRecommender):
             recommendations, self.source_language, self.target_language, self.count
         )
 
-    async def get_recommendations_by_status(self, missing=True) -> List[TranslationRecommendation]:
+    async def get_recommendations_by_status(self, missing=True, limit=None) -> List[TranslationRecommendation]:
         """
         Retrieves the top pageview candidates based on the given source and target language, and the
         given present/missing status - as indicated by the "missing" argument.
 
         Args:
             missing: A boolean indicating whether we need to return present or missing recommendations.
+            limit: An optional maximum number of recommendations to return.
 
         Returns:
             list: A list of TranslationRecommendation objects representing the top pageview candidates.
@@ -50,36 +60,29 @@ class PopularRecommender(BaseRecommender):
         articles = await self.fetch_most_popular_articles()
 
         recommendations = []
+        target_language = self.target_language
 
         for index, article in enumerate(articles):
-            if "disambiguation" not in article.get("pageprops", {}):
-                languages = [langlink["lang"] for langlink in article.get("langlinks", [])]
-                if missing == (self.target_language not in languages):
-                    rec = TranslationRecommendation(
-                        title=article.get("title"),
-                        rank=index,
-                        langlinks_count=int(article.get("langlinkscount", 0)),
-                        languages=languages,
-                        wikidata_id=article.get("pageprops", {}).get("wikibase_item"),
-                    )
-                    recommendations.append(rec)
-
-        return sort_recommendations(recommendations, self.rank_method)
+            # The query limits langlinks to the target language, so a single match means the article exists
+            missing_in_target = not any(
+                langlink["lang"] == target_language for langlink in article.get("langlinks", [])
+            )
+            if missing == missing_in_target:
+                # Skip validation, the fields come straight from the MediaWiki API response
+                rec = TranslationRecommendation.model_construct(
+                    title=article.get("title"),
+                    rank=index,
+                    langlinks_count=article.get("langlinkscount", 0),
+                    wikidata_id=article.get("pageprops", {}).get("wikibase_item"),
+                )
+                recommendations.append(rec)
+
+        return sort_recommendations(recommendations, self.rank_method, limit)
 
     async def fetch_most_popular_articles(self):
         endpoint = get_formatted_endpoint(configuration.WIKIPEDIA_API, self.source_language)
         headers = set_headers_with_host_header(configuration.WIKIPEDIA_API_HEADER, self.source_language)
-        params = {
-            "action": "query",
-            "format": "json",
-            "formatversion": 2,
-            "prop": "langlinks|langlinkscount|pageprops",
-            "lllimit": "max",
-            "lllang": self.target_language,
-            "generator": "mostviewed",
-            "gpvimlimit": "max",
-            "ppprop": "wikibase_item|disambiguation",
-        }
+        params = {**MOST_VIEWED_QUERY_PARAMS, "lllang": self.target_language}
 
         try:
             data = await get(api_url=endpoint, params=params, headers=headers)
@@ -91,6 +94,10 @@ class PopularRecommender(BaseRecommender):
             log.info("pageview data is not in a known format")
             return []
 
-        # Filter for main namespace articles
-        pages = [page for page in data["query"]["pages"] if page["ns"] == 0]
+        # Filter for main namespace articles that are not disambiguation pages
+        pages = [
+            page
+            for page in data["query"]["pages"]
+            if page["ns"] == 0 and "disambiguation" not in page.get("pageprops", {})
+        ]
         return pages
@@ -5,16 +5,20 @@ from recommendation.recommenders.search_recommender import SearchRecommender
 
 
 class RecommenderFactory:
+    # Recommender classes in order of precedence; the first one matching the request is used
+    recommender_classes = [
+        CollectionRecommender,
+        SearchRecommender,
+        PopularRecommender,
+    ]
+
     def __init__(self, request_model: TranslationRecommendationRequest):
-        # Create recommender instances with the request model
-        self.recommenders = [
-            CollectionRecommender(request_model),
-            SearchRecommender(request_model),
-            PopularRecommender(request_model),
-        ]
+        self.request_model = request_model
 
     def get_recommender(self):
-        for recommender in self.recommenders:
+        # Create recommender instances lazily, so only the ones up to the first match are built
+        for recommender_class in self.recommender_classes:
+            recommender = recommender_class(self.request_model)
             if recommender.match():
                 return recommender
         raise ValueError("No matching recommender found.")
@@ -1,4 +1,7 @@
-from typing import Dict, List
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, List, Tuple
 
 from recommendation.api.translation.models import (
     SectionTranslationRecommendation,
@@ -6,10 +9,60 @@ from recommendation.api.translation.models import (
     TranslationRecommendationRequest,
 )
 from recommendation.external_data.fetcher import get, get_endpoint_and_headers
+from recommendation.utils.configuration import configuration
 from recommendation.utils.logger import log
 from recommendation.utils.recommendation_helper import sort_recommendations
+from recommendation.utils.search_query_builder import build_search_query
 from recommendation.utils.section_recommendation_helper import get_section_suggestions_for_recommendations
 
+# Static part of the search generator query, the language and search expression are added per request
+SEARCH_QUERY_PARAMS = {
+    "action": "query",
+    "format": "json",
+    "formatversion": 2,
+    "prop": "langlinks|langlinkscount|pageprops",
+    "lllimit": "max",
+    "generator": "search",
+    "gsrprop": "wordcount",
+    "gsrnamespace": 0,
+    "gsrwhat": "text",
+    "gsrlimit": "max",
+    "ppprop": "wikibase_item|disambiguation",
+    "gsrqiprofile": "classic_noboostlinks",
+}
+
+# In-process LRU of search results for deterministic queries, mapping (endpoint, params) to (expiry time, pages)
+_search_results_cache: OrderedDict = OrderedDict()
+
+
+def get_cached_search_results(key: Tuple) -> List | None:
+    entry = _search_results_cache.get(key)
+    if entry is None:
+        return None
+
+    expires_at, pages = entry
+    if expires_at < time.monotonic():
+        del _search_results_cache[key]
+        return None
+
+    _search_results_cache.move_to_end(key)
+    return pages
+
+
+def cache_search_results(key: Tuple, pages: List):
+    if configuration.SEARCH_RESULTS_CACHE_SIZE <= 0:
+        return
+
+    now = time.monotonic()
+    # Drop expired entries, so the TTL bounds memory use and not only the staleness of the results
+    for expired_key in [k for k, (expires_at, _) in _search_results_cache.items() if expires_at < now]:
+        del _search_results_cache[expired_key]
+
+    _search_results_cache[key] = (now + configuration.SEARCH_RESULTS_CACHE_TTL, pages)
+    _search_results_cache.move_to_end(key)
+    while len(_search_results_cache) > configuration.SEARCH_RESULTS_CACHE_SIZE:
+        _search_results_cache.popitem(last=False)
+
 
 class SearchRecommender:
     def __init__(self, request_model: TranslationRecommendationRequest):
@@ -33,8 +86,13 @@ class SearchRecommender:
             "include_pageviews": self.include_pageviews,
         }
 
+    def log_unmapped_request(self):
+        # debug_request_params builds a new dict, so only compute it when the message will be emitted
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Recommendation request %s does not map to an article", self.debug_request_params)
+
     def match(self) -> bool:
-        return bool(self.topic or self.seed)
+        return bool(self.seed or self.topic)
 
     async def recommend(self) -> List[TranslationRecommendation]:
         """
@@ -43,10 +101,7 @@ class SearchRecommender:
         Returns:
             List[TranslationRecommendation]: A list of translation recommendations.
         """
-        recommendations = await self.get_recommendations_by_status(missing=True)
-        recommendations = recommendations[: self.count]
-
-        return recommendations
+        return await self.get_recommendations_by_status(missing=True, limit=self.count)
 
     async def recommend_sections(self) -> List[SectionTranslationRecommendation]:
         """
@@ -62,58 +117,66 @@ class SearchRecommender:
             recommendations, self.source_language, self.target_language, self.count
         )
 
-    async def get_recommendations_by_status(self, missing=True) -> List[TranslationRecommendation]:
+    async def get_recommendations_by_status(self, missing=True, limit=None) -> List[TranslationRecommendation]:
         results = await self.search_wiki()
 
-        if len(results) == 0:
-            log.debug(f"Recommendation request {self.debug_request_params} does not map to an article")
-            return []
-
         recommendations = []
+        target_language = self.target_language
 
         for page in results:
-            if "disambiguation" not in page.get("pageprops", {}):
-                languages = [langlink["lang"] for langlink in page.get("langlinks", [])]
-                if missing == (self.target_language not in languages):
-                    rec = TranslationRecommendation(
-                        title=page["title"],
-                        rank=page["index"],
-                        langlinks_count=int(page.get("langlinkscount", 0)),
-                        languages=languages,
-                        wikidata_id=page.get("pageprops", {}).get("wikibase_item"),
-                    )
-                    recommendations.append(rec)
-
-        return sort_recommendations(recommendations, self.rank_method)
+            # The query limits langlinks to the target language, so a single match means the article exists
+            missing_in_target = not any(langlink["lang"] == target_language for langlink in page.get("langlinks", []))
+            if missing == missing_in_target:
+                # Skip validation, the fields come straight from the MediaWiki API response
+                rec = TranslationRecommendation.model_construct(
+                    title=page["title"],
+                    rank=page["index"],
+                    langlinks_count=page.get("langlinkscount", 0),
+                    wikidata_id=page.get("pageprops", {}).get("wikibase_item"),
+                )
+                recommendations.append(rec)
+
+        return sort_recommendations(recommendations, self.rank_method, limit)
 
     async def search_wiki(self):
         """
         This method sends a request to the source Wikipedia API, to fetch the related pages based on the
-        request parameters.
+        request parameters. Disambiguation pages are filtered out. Results of deterministic queries are cached
+        for SEARCH_RESULTS_CACHE_TTL seconds, while randomly sorted (topic) queries always hit the API. The
+        returned pages may be shared between requests and must not be mutated.
 
         Returns:
-            list: A list of pages that match the search query.
+            list: A list of non-disambiguation pages that match the search query.
         """
         endpoint, params, headers = self.build_wiki_search()
 
+        cache_key = None
+        if params.get("gsrsort") != "random":
+            cache_key = (endpoint, tuple(sorted(params.items())))
+            pages = get_cached_search_results(cache_key)
+            if pages is not None:
+                return pages
+
         try:
             response = await get(endpoint, params=params, headers=headers)
         except ValueError:
             log.error(
-                f"Could not search for articles related to search {self.debug_request_params}. Choose another language."
+                "Could not search for articles related to search %s. Choose another language.",
+                self.debug_request_params,
             )
             return []
 
-        if "query" not in response or "pages" not in response["query"]:
-            log.debug(f"Recommendation request {self.debug_request_params} does not map to an article")
-            return []
-
-        pages = response["query"]["pages"]
+        pages = response.get("query", {}).get("pages")
+        if pages:
+            pages = [page for page in pages if "disambiguation" not in page.get("pageprops", {})]
 
-        if len(pages) == 0:
-            log.debug(f"Recommendation request {self.debug_request_params} does not map to an article")
+        if not pages:
+            self.log_unmapped_request()
             return []
 
+        if cache_key:
+            cache_search_results(cache_key, pages)
+
         return pages
 
     def build_wiki_search(self):
@@ -125,43 +188,12 @@ class SearchRecommender:
         """
         endpoint, headers = get_endpoint_and_headers(self.source_language)
 
-        params = {
-            "action": "query",
-            "format": "json",
-            "formatversion": 2,
-            "prop": "langlinks|langlinkscount|pageprops",
-            "lllimit": "max",
-            "lllang": self.target_language,
-            "generator": "search",
-            "gsrprop": "wordcount",
-            "gsrnamespace": 0,
-            "gsrwhat": "text",
-            "gsrlimit": "max",
-            "ppprop": "wikibase_item|disambiguation",
-            "gsrqiprofile": "classic_noboostlinks",
-        }
-
-        gsrsearch_query = []
+        params = {**SEARCH_QUERY_PARAMS, "lllang": self.target_language}
 
         if self.topic:
             params["gsrsort"] = "random"
-            topics = self.topic.replace(" ", "-").lower()
-            topic_and_items = topics.split("+")
-            search_expression = "+".join(
-                [f"articletopic:{topic_and_item.strip()}" for topic_and_item in topic_and_items]
-            )
-            gsrsearch_query.append(search_expression)
-
-        if self.seed:
-            # morelike is a "greedy" keyword, meaning that it cannot be combined with other search queries.
-            # To use other search queries, use morelikethis in your search:
-            # https://www.mediawiki.org/wiki/Help:CirrusSearch#morelike
-            if len(gsrsearch_query):
-                gsrsearch_query.append(f"morelikethis:{self.seed}")
-            else:
-                gsrsearch_query.append(f"morelike:{self.seed}")
 
-        params["gsrsearch"] = " ".join(gsrsearch_query)
+        params["gsrsearch"] = build_search_query(self.topic, self.seed)
 
-        log.debug(f"Search params: {params}")
+        log.debug("Search params: %s", params)
         return endpoint, params, headers
@@ -0,0 +1,28 @@
+from functools import lru_cache
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from recommendation.main import app
+
+
+@lru_cache(maxsize=None)
+def get_transport() -> ASGITransport:
+    # Shared by every client created in the session, even if a fixture is requested with a narrower scope
+    return ASGITransport(app=app)
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def client():
+    # Build the OpenAPI schema once up front, FastAPI keeps it on app.openapi_schema for later requests
+    app.openapi()
+    # The ASGI transport never touches the network, so skip reading proxy settings from the environment
+    async with AsyncClient(
+        transport=get_transport(), base_url=f"http://test{app.root_path}", trust_env=False
+    ) as client:
+        yield client
@@ -1,4 +1,7 @@
-from locust import HttpUser, between, task
+import random
+from urllib.parse import quote
+
+from locust import FastHttpUser, between, task
 
 # Tests for the recommendation endpoint
 tests = [
@@ -21,28 +24,33 @@ tests = [
     ("kk", "en", 3, "Қазақ_тілі"),
 ]
 
+TRANSLATION_PATH = "/api/v1/translation"
 
-class RecommendationAPIUser(HttpUser):
-    wait_time = between(1, 3)
+# Request paths are built and percent-encoded once at import time, not on every task run
+PATHS_MORELIKE = tuple(
+    f"{TRANSLATION_PATH}?source={source}&target={target}&count={count}&seed={quote(seed)}&algorithm=morelike"
+    for source, target, count, seed in tests
+)
+PATHS_MOSTPOPULAR = tuple(
+    f"{TRANSLATION_PATH}?source={source}&target={target}&count={count}&algorithm=mostpopular"
+    for source, target, count, seed in tests
+)
+PATHS_MORELIKE_PAGEVIEWS = tuple(f"{path}&include_pageviews=true" for path in PATHS_MORELIKE)
 
-    @task
-    def translation_recommendation_morelike(self):
-        for test in tests:
-            (source, target, count, seed) = test
-            self.client.get(
-                f"/api/v1/translation?source={source}&target={target}&count={count}&seed={seed}&algorithm=morelike"
-            )
+# (path, stats name) pairs for every request flavor, requests are grouped by name so the stats have one
+# entry per flavor rather than one per language pair
+REQUESTS = (
+    *((path, f"{TRANSLATION_PATH} [morelike]") for path in PATHS_MORELIKE),
+    *((path, f"{TRANSLATION_PATH} [mostpopular]") for path in PATHS_MOSTPOPULAR),
+    *((path, f"{TRANSLATION_PATH} [morelike, pageviews]") for path in PATHS_MORELIKE_PAGEVIEWS),
+)
 
-    @task
-    def translation_recommendation_mostpopular(self):
-        for test in tests:
-            (source, target, count, seed) = test
-            self.client.get(f"/api/v1/translation?source={source}&target={target}&count={count}&algorithm=mostpopular")
+
+class RecommendationAPIUser(FastHttpUser):
+    wait_time = between(1, 3)
 
     @task
-    def translation_recommendation_morelike_pageviews(self):
-        for test in tests:
-            (source, target, count, seed) = test
-            self.client.get(
-                f"/api/v1/translation?source={source}&target={target}&count={count}&seed={seed}&algorithm=morelike&include_pageviews=true"
-            )
+    def translation_recommendation(self):
+        # One request per task run, so the user waits between requests like a real client would
+        path, name = random.choice(REQUESTS)
+        self.client.get(path, name=name)
@@ -1,19 +1,14 @@
-import pytest
-from httpx import ASGITransport, AsyncClient
-
-from recommendation.main import app
+from typing import List
 
+import pytest
+from httpx import AsyncClient
+from pydantic import TypeAdapter
 
-@pytest.fixture(scope="session")
-def anyio_backend():
-    return "asyncio"
-
+from recommendation.api.translation.models import SectionTranslationRecommendation, TranslationRecommendation
 
-@pytest.fixture(scope="session")
-async def client():
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url=f"http://test{app.root_path}") as client:
-        yield client
+# Response validators are built once at import, instead of checking each field by hand in every test
+recommendations_adapter = TypeAdapter(List[TranslationRecommendation])
+section_recommendations_adapter = TypeAdapter(List[SectionTranslationRecommendation])
 
 
 @pytest.mark.anyio
@@ -43,44 +38,27 @@ async def test_language_validation(client: AsyncClient):
 
 
 @pytest.mark.anyio
-async def test_recommendations_morelike(client: AsyncClient):
-    response = await client.get("/v1/translation?source=en&target=es&seed=Apple&search_algorithm=morelike")
-    assert response.status_code == 200
-    results = response.json()
-    assert len(results) > 0
-    assert results[0].get("title")
-    assert results[0].get("pageviews") == 0
-    assert results[0].get("wikidata_id")
-    assert results[0].get("rank") > 0
-    assert results[0].get("langlinks_count") >= 0
-
-
-@pytest.mark.anyio
-async def test_recommendations_mostpopular(client: AsyncClient):
-    response = await client.get("/v1/translation?source=en&target=es&seed=Moon&search_algorithm=morelike")
-    assert response.status_code == 200
-    results = response.json()
-    assert len(results) > 0
-    assert results[0].get("title")
-    assert results[0].get("pageviews") == 0
-    assert results[0].get("wikidata_id")
-    assert results[0].get("rank") > 0
-    assert results[0].get("langlinks_count") >= 0
-
-
-@pytest.mark.anyio
-async def test_recommendations_with_pageviews(client: AsyncClient):
-    response = await client.get(
-        "/v1/translation?source=en&target=es&seed=Apple&search_algorithm=morelike&include_pageviews=True"
-    )
+@pytest.mark.parametrize(
+    "query, include_pageviews",
+    [
+        pytest.param("seed=Apple&search_algorithm=morelike", False, id="morelike"),
+        pytest.param("seed=Moon&search_algorithm=morelike", False, id="morelike_moon"),
+        pytest.param("seed=Apple&search_algorithm=morelike&include_pageviews=True", True, id="with_pageviews"),
+    ],
+)
+async def test_recommendations(client: AsyncClient, query: str, include_pageviews: bool):
+    response = await client.get(f"/v1/translation?source=en&target=es&{query}")
     assert response.status_code == 200
-    results = response.json()
+    results = recommendations_adapter.validate_json(response.content)
     assert len(results) > 0
-    assert results[0].get("title")
-    assert results[0].get("pageviews") >= 0
-    assert results[0].get("wikidata_id")
-    assert results[0].get("rank") > 0
-    assert results[0].get("langlinks_count") >= 0
+    assert results[0].title
+    if include_pageviews:
+        assert results[0].pageviews >= 0
+    else:
+        assert results[0].pageviews == 0
+    assert results[0].wikidata_id
+    assert results[0].rank > 0
+    assert results[0].langlinks_count >= 0
 
 
 @pytest.mark.anyio
@@ -89,11 +67,11 @@ async def test_section_recommendations(client: AsyncClient):
         "/v1/translation/sections?source=en&target=es&seed=Apple&search_algorithm=morelike&count=12"
     )
     assert response.status_code == 200
-    results = response.json()
+    results = section_recommendations_adapter.validate_json(response.content)
     assert len(results) == 12
-    assert results[0].get("source_title")
-    assert results[0].get("target_title")
-    assert results[0].get("source_sections")
-    assert results[0].get("target_sections")
-    assert results[0].get("present")
-    assert results[0].get("missing")
+    assert results[0].source_title
+    assert results[0].target_title
+    assert results[0].source_sections
+    assert results[0].target_sections
+    assert results[0].present
+    assert results[0].missing
@@ -0,0 +1,42 @@
+import pytest
+
+from recommendation.api.translation.models import PageCollection, PageCollectionsList, WikiPage
+from recommendation.cache import JSONDisk, PageCollectionCache
+
+
+def make_page_collections_list(name: str, revision_id: int = 1) -> PageCollectionsList:
+    page = WikiPage(id=1, title=name, revision_id=revision_id, language="en", wiki="meta")
+    return PageCollectionsList(list=[PageCollection(name=name, pages={page})])
+
+
+@pytest.fixture
+def page_collection_cache(tmp_path):
+    cache = PageCollectionCache(disk=JSONDisk, directory=str(tmp_path))
+    yield cache
+    cache.close()
+
+
+def test_unversioned_page_collections_are_memoized(page_collection_cache):
+    # Collections written before versioning existed have no version key
+    page_collection_cache.set("page_collections", make_page_collections_list("Women"))
+
+    page_collections = page_collection_cache.get_page_collections()
+    assert [collection.name for collection in page_collections] == ["Women"]
+    assert page_collection_cache.get_page_collections() is page_collections
+
+    cache_key = page_collections[0].cache_key
+    assert page_collection_cache.get_page_collection_by_cache_key(cache_key) is page_collections[0]
+    assert page_collection_cache.get_page_collections() is page_collections
+
+
+def test_page_collections_are_reloaded_after_update(page_collection_cache):
+    page_collection_cache.set_page_collections(make_page_collections_list("Women"))
+    page_collections = page_collection_cache.get_page_collections()
+    assert page_collection_cache.get_page_collections() is page_collections
+    assert page_collection_cache.get_page_collections_by_name("women") == page_collections
+
+    page_collection_cache.set_page_collections(make_page_collections_list("Space", revision_id=2))
+    updated_page_collections = page_collection_cache.get_page_collections()
+    assert updated_page_collections is not page_collections
+    assert [collection.name for collection in updated_page_collections] == ["Space"]
+    assert page_collection_cache.get_page_collections_by_name("women") == []
@@ -0,0 +1,52 @@
+import pytest
+
+from recommendation.api.translation import models
+from recommendation.api.translation.models import PageCollection, WikiDataArticle, WikiPage
+from recommendation.utils import collection_fetcher
+
+APPLE = WikiDataArticle(wikidata_id="Q89", langlinks={"en": "Apple", "es": "Manzana"})
+MOON = WikiDataArticle(wikidata_id="Q405", langlinks={"en": "Moon"})
+BANANA = WikiDataArticle(wikidata_id="Q503", langlinks={"es": "Banana"})
+
+
+def make_page_collection(articles) -> PageCollection:
+    page = WikiPage(id=1, title="Fruits", revision_id=1, language="en", wiki="meta")
+    return PageCollection(name="Fruits", pages={page}, articles=articles)
+
+
+def test_get_candidates():
+    page_collection = make_page_collection([APPLE, MOON, BANANA])
+
+    candidates = page_collection.get_candidates("en", "es")
+
+    assert candidates == [(APPLE, "Apple", "Manzana"), (MOON, "Moon", None)]
+    assert page_collection.get_candidates("en", "es") is candidates
+
+
+def test_get_candidates_memo_is_bounded(monkeypatch):
+    monkeypatch.setattr(models, "CANDIDATES_CACHE_SIZE", 2)
+    page_collection = make_page_collection([APPLE, MOON, BANANA])
+
+    candidates = page_collection.get_candidates("en", "es")
+    page_collection.get_candidates("es", "en")
+    page_collection.get_candidates("en", "es")
+    page_collection.get_candidates("en", "fr")
+
+    assert page_collection.get_candidates("en", "es") is candidates
+    assert list(page_collection._candidates_by_language_pair) == [("en", "fr"), ("en", "es")]
+
+
+@pytest.mark.anyio
+async def test_fetch_articles_clears_memos(monkeypatch):
+    async def fake_get_candidates_in_collection_page(page):
+        return [BANANA]
+
+    monkeypatch.setattr(collection_fetcher, "get_candidates_in_collection_page", fake_get_candidates_in_collection_page)
+    page_collection = make_page_collection([APPLE])
+    assert page_collection.get_candidates("es", "en") == [(APPLE, "Manzana", "Apple")]
+    assert page_collection.get_metadata("es").articles_by_language_count == {"es": 1}
+
+    await page_collection.fetch_articles()
+
+    assert page_collection.get_candidates("es", "en") == [(APPLE, "Manzana", "Apple"), (BANANA, "Banana", None)]
+    assert page_collection.get_metadata("es").articles_by_language_count == {"es": 2}
@@ -0,0 +1,24 @@
+import pytest
+
+from recommendation.api.translation.models import RankMethodEnum, TranslationRecommendation
+from recommendation.utils.recommendation_helper import sort_recommendations
+
+RECOMMENDATIONS = [
+    TranslationRecommendation.model_construct(title=f"Article {i}", langlinks_count=count)
+    for i, count in enumerate([5, 42, 0, 17, 8, 23])
+]
+
+
+@pytest.mark.parametrize("limit", [1, 3, 6, 10])
+def test_sort_by_sitelinks_with_limit(limit):
+    expected = sorted(RECOMMENDATIONS, key=lambda x: x.langlinks_count, reverse=True)[:limit]
+    assert sort_recommendations(RECOMMENDATIONS, RankMethodEnum.sitelinks, limit) == expected
+
+
+@pytest.mark.parametrize("limit", [1, 3, 6, 10])
+def test_default_sort_with_limit(limit):
+    results = sort_recommendations(RECOMMENDATIONS, RankMethodEnum.default, limit)
+
+    assert len(results) == min(limit, len(RECOMMENDATIONS))
+    assert len({recommendation.title for recommendation in results}) == len(results)
+    assert all(recommendation in RECOMMENDATIONS for recommendation in results)
@@ -0,0 +1,17 @@
+import pytest
+
+from recommendation.utils.search_query_builder import build_search_query
+
+
+@pytest.mark.parametrize(
+    "topic, seed, expected",
+    [
+        ("Fashion", None, "articletopic:fashion"),
+        ("Music+South Africa", None, "articletopic:music+articletopic:south-africa"),
+        (None, "Apple", "morelike:Apple"),
+        ("Women+Space", "Apple", "articletopic:women+articletopic:space morelikethis:Apple"),
+        (None, None, ""),
+    ],
+)
+def test_build_search_query(topic, seed, expected):
+    assert build_search_query(topic, seed) == expected
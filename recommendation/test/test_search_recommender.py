@@ -0,0 +1,95 @@
+import pytest
+
+from recommendation.api.translation.models import RankMethodEnum, TranslationRecommendationRequest
+from recommendation.recommenders import search_recommender
+from recommendation.recommenders.search_recommender import (
+    SearchRecommender,
+    cache_search_results,
+    get_cached_search_results,
+)
+from recommendation.utils.configuration import configuration
+
+PAGES = [{"title": "Apple", "index": 1}]
+
+
+@pytest.fixture(autouse=True)
+def search_results_cache(monkeypatch):
+    monkeypatch.setattr(configuration, "SEARCH_RESULTS_CACHE_SIZE", 2)
+    monkeypatch.setattr(configuration, "SEARCH_RESULTS_CACHE_TTL", 60)
+    search_recommender._search_results_cache.clear()
+    yield search_recommender._search_results_cache
+    search_recommender._search_results_cache.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(search_recommender.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_cache_hit(clock):
+    cache_search_results("a", PAGES)
+    assert get_cached_search_results("a") is PAGES
+    assert get_cached_search_results("b") is None
+
+
+def test_cache_expiry(clock, search_results_cache):
+    cache_search_results("a", PAGES)
+    clock[0] += 61
+    assert get_cached_search_results("a") is None
+    assert "a" not in search_results_cache
+
+
+def test_expired_entries_are_purged_on_insert(clock, search_results_cache):
+    cache_search_results("a", PAGES)
+    clock[0] += 61
+    cache_search_results("b", PAGES)
+    assert list(search_results_cache) == ["b"]
+
+
+def test_least_recently_used_entry_is_evicted(clock, search_results_cache):
+    cache_search_results("a", PAGES)
+    cache_search_results("b", PAGES)
+    get_cached_search_results("a")
+    cache_search_results("c", PAGES)
+    assert list(search_results_cache) == ["a", "c"]
+
+
+def test_size_zero_disables_cache(clock, monkeypatch, search_results_cache):
+    monkeypatch.setattr(configuration, "SEARCH_RESULTS_CACHE_SIZE", 0)
+    cache_search_results("a", PAGES)
+    assert len(search_results_cache) == 0
+    assert get_cached_search_results("a") is None
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "seed, topic, expected_calls",
+    [
+        pytest.param("Apple", None, 1, id="cached"),
+        pytest.param(None, "Fashion", 2, id="random_sort_bypass"),
+    ],
+)
+async def test_search_wiki_cache(monkeypatch, seed, topic, expected_calls):
+    calls = []
+
+    async def fake_get(api_url, params=None, headers=None):
+        calls.append(params)
+        return {"query": {"pages": PAGES}}
+
+    monkeypatch.setattr(search_recommender, "get", fake_get)
+    request_model = TranslationRecommendationRequest.model_construct(
+        source="en",
+        target="es",
+        count=12,
+        seed=seed,
+        topic=topic,
+        include_pageviews=False,
+        rank_method=RankMethodEnum.default,
+    )
+
+    for _ in range(2):
+        assert await SearchRecommender(request_model).search_wiki() == PAGES
+
+    assert len(calls) == expected_calls
@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+
+import pytest
+
+from recommendation.utils import sitematrix_helper
+from recommendation.utils.sitematrix_helper import clear_dbname_cache, get_dbname_by_prefix
+
+INTERWIKI_MAP = [
+    {"prefix": "en", "url": "https://en.wikipedia.org/wiki/$1"},
+    {"prefix": "xx", "url": "https://xx.wikipedia.org/wiki/$1"},
+]
+SITEMATRIX = [{"site": [{"url": "https://en.wikipedia.org", "dbname": "enwiki"}]}]
+
+
+@pytest.fixture
+def lookups(monkeypatch):
+    lookups = []
+
+    def get_interwiki_map():
+        lookups.append(1)
+        return INTERWIKI_MAP
+
+    monkeypatch.setattr(
+        sitematrix_helper, "get_interwiki_map_cache", lambda: SimpleNamespace(get_interwiki_map=get_interwiki_map)
+    )
+    monkeypatch.setattr(
+        sitematrix_helper, "get_sitematrix_cache", lambda: SimpleNamespace(get_sitematrix=lambda: SITEMATRIX)
+    )
+    clear_dbname_cache()
+    yield lookups
+    clear_dbname_cache()
+
+
+def test_found_dbname_is_cached(lookups):
+    assert get_dbname_by_prefix("en") == "enwiki"
+    assert get_dbname_by_prefix("en") == "enwiki"
+    assert len(lookups) == 1
+
+
+def test_missing_dbname_is_not_cached(lookups):
+    assert get_dbname_by_prefix("xx") is None
+    assert get_dbname_by_prefix("xx") is None
+    assert len(lookups) == 2
+
+
+def test_clear_dbname_cache(lookups):
+    get_dbname_by_prefix("en")
+    clear_dbname_cache()
+    get_dbname_by_prefix("en")
+    assert len(lookups) == 2
@@ -1,4 +1,5 @@
-from typing import Dict, List, Optional, Set
+import asyncio
+from typing import Dict, List, Set
 
 from recommendation.api.translation.models import (
     PageCollection,
@@ -9,17 +10,9 @@ from recommendation.api.translation.models import (
 from recommendation.cache import get_interwiki_map_cache, get_page_collection_cache, get_sitematrix_cache
 from recommendation.external_data import fetcher
 from recommendation.utils.collection_fetcher import get_collection_metadata_by_pages, get_collection_pages
+from recommendation.utils.configuration import configuration
 from recommendation.utils.logger import log
-
-
-def find_page_collection_by_cache_key(
-    cached_page_collections: Set[PageCollection], collection_key: str
-) -> Optional[PageCollection]:
-    for collection in cached_page_collections:
-        if collection.cache_key == collection_key:
-            return collection  # Return the collection when found
-
-    return None  # Return None if no match is found
+from recommendation.utils.sitematrix_helper import clear_dbname_cache
 
 
 def combine_collection_pages_and_metadata(
@@ -53,20 +46,30 @@ async def update_page_collection_cache():
         collection_pages, collection_metadata_by_pages
     )
     page_collection_cache = get_page_collection_cache()
-    cached_page_collections: Set[PageCollection] = page_collection_cache.get_page_collections() or set()
+    # Load and index the cached page collections once, the lookups below reuse that load
+    page_collection_cache.get_page_collections()
     page_collections_list: PageCollectionsList = PageCollectionsList()
+    uncached_page_collections: List[PageCollection] = []
 
     for live_page_collection in fetched_page_collections:
-        cached_page_collection = find_page_collection_by_cache_key(
-            cached_page_collections, live_page_collection.cache_key
-        )
+        cached_page_collection = page_collection_cache.get_page_collection_by_cache_key(live_page_collection.cache_key)
 
         if cached_page_collection:
             page_collections_list.add(cached_page_collection)
-            log.debug(f"Found page collection {cached_page_collection} in cache")
+            log.debug("Found page collection %s in cache", cached_page_collection)
         else:
-            await live_page_collection.fetch_articles()
-            page_collections_list.add(live_page_collection)
+            uncached_page_collections.append(live_page_collection)
+
+    semaphore = asyncio.Semaphore(configuration.API_CONCURRENCY_LIMIT)
+
+    async def fetch_articles_with_semaphore(page_collection: PageCollection):
+        async with semaphore:
+            await page_collection.fetch_articles()
+
+    # Fetch the articles of all new or updated page collections concurrently
+    await asyncio.gather(*[fetch_articles_with_semaphore(collection) for collection in uncached_page_collections])
+    for page_collection in uncached_page_collections:
+        page_collections_list.add(page_collection)
 
     page_collection_cache.set_page_collections(page_collections_list)
 
@@ -77,6 +80,7 @@ async def initialize_interwiki_map_cache():
 
     interwiki_map_cache = get_interwiki_map_cache()
     interwiki_map_cache.set_interwiki_map(interwiki_map)
+    clear_dbname_cache()
 
 
 async def initialize_sitematrix_cache():
@@ -84,11 +88,10 @@ async def initialize_sitematrix_cache():
 
     sitematrix_cache = get_sitematrix_cache()
     sitematrix_cache.set_sitematrix(sitematrix)
+    clear_dbname_cache()
 
 
 def start():
-    import asyncio
-
     async def initialize_cache():
         await initialize_interwiki_map_cache()
         await initialize_sitematrix_cache()
@@ -8,6 +8,14 @@ from recommendation.utils.configuration import configuration
 from recommendation.utils.logger import log
 from recommendation.utils.sitematrix_helper import get_dbname_by_prefix
 
+# Matches link titles that start with a Wikidata QID, e.g. "Q42"
+QID_PATTERN = re.compile(r"(Q[\d]+)")
+
+# Shared by all batch fetches so that API_CONCURRENCY_LIMIT bounds the requests in flight across batches.
+# It is created lazily, since a semaphore is bound to the event loop it is used in.
+_api_semaphore: asyncio.Semaphore | None = None
+_api_semaphore_loop: asyncio.AbstractEventLoop | None = None
+
 
 async def get_collection_pages() -> List[WikiPage]:
     """
@@ -113,7 +121,7 @@ async def get_candidates_in_collection_page(page: WikiPage) -> List[WikiDataArti
         prefix = link.get("prefix", page.wiki)
         url = link.get("url", "")
 
-        qid_match = re.match(r"(Q[\d]+)", title)
+        qid_match = QID_PATTERN.match(title)
         if qid_match and url.startswith("https://www.wikidata.org"):
             qid = qid_match.group(1)
             qids.append(qid)
@@ -129,24 +137,26 @@ async def get_candidates_in_collection_page(page: WikiPage) -> List[WikiDataArti
     # Create a list to store the results
     wikidata_articles = await process_batches(batches, get_articles_by_qids)
 
-    wikidata_articles_links_by_language = {}
+    # Titles of the articles already retrieved from wikidata, converted to underscore format, by language
+    wikidata_titles_by_language = {}
     for wikidata_article in wikidata_articles:
         for language, title in wikidata_article.langlinks.items():
-            if language not in wikidata_articles_links_by_language:
-                wikidata_articles_links_by_language[language] = []
-            wikidata_articles_links_by_language[language].append(title)
+            if language not in wikidata_titles_by_language:
+                wikidata_titles_by_language[language] = set()
+            wikidata_titles_by_language[language].add(title.replace(" ", "_"))
 
     for language in links_group_by_language:
         # Filter out language links that were already retrieve from wikidata
         initial_count = len(links_group_by_language[language])
-        titles_from_wikidata = wikidata_articles_links_by_language.get(language, [])
-        # Convert titles from wikidata to underscore format
-        titles_from_wikidata = [title.replace(" ", "_") for title in titles_from_wikidata]
-        titles = list(set(links_group_by_language[language]) - set(titles_from_wikidata))
+        titles_from_wikidata = wikidata_titles_by_language.get(language, set())
+        # Deduplicate the remaining titles, keeping their order in the page
+        titles = list(
+            dict.fromkeys(title for title in links_group_by_language[language] if title not in titles_from_wikidata)
+        )
         final_count = len(titles)
         skipped = initial_count - final_count
         if skipped > 0:
-            log.debug(f"Skipped {skipped}/{initial_count} links for {language} as they are already in the cache")
+            log.debug("Skipped %d/%d links for %s as they are already in the cache", skipped, initial_count, language)
 
         # Split the remaining titles into batches of 50
         batches = [titles[i : i + 50] for i in range(0, len(titles), 50)]
@@ -159,9 +169,19 @@ async def get_candidates_in_collection_page(page: WikiPage) -> List[WikiDataArti
     return wikidata_articles_with_langlinks
 
 
+def get_api_semaphore() -> asyncio.Semaphore:
+    global _api_semaphore, _api_semaphore_loop
+
+    loop = asyncio.get_running_loop()
+    if _api_semaphore is None or _api_semaphore_loop is not loop:
+        _api_semaphore = asyncio.Semaphore(configuration.API_CONCURRENCY_LIMIT)
+        _api_semaphore_loop = loop
+
+    return _api_semaphore
+
+
 async def fetch_with_semaphore(batch, fetch_function, *args):
-    semaphore = asyncio.Semaphore(configuration.API_CONCURRENCY_LIMIT)  # Limit to 10 concurrent tasks
-    async with semaphore:
+    async with get_api_semaphore():
         return await fetch_function(batch, *args)
 
 
@@ -187,6 +207,18 @@ async def get_collection_metadata_by_pages(pages: List[WikiPage]) -> Dict[str, P
     Returns:
         Dict[str, PageCollectionMetadata] a dictionary mapping the page id (int) of each page to its metadata
     """
+    # Split the pages into batches of 50, the maximum number of titles the API accepts per request
+    batches = [pages[i : i + 50] for i in range(0, len(pages), 50)]
+    tasks = [fetch_with_semaphore(batch, get_collection_metadata_by_batch) for batch in batches]
+
+    metadata_by_pages = {}
+    for batch_metadata_by_pages in await asyncio.gather(*tasks):
+        metadata_by_pages.update(batch_metadata_by_pages)
+
+    return metadata_by_pages
+
+
+async def get_collection_metadata_by_batch(pages: List[WikiPage]) -> Dict[str, PageCollectionMetadata]:
     endpoint, headers = get_endpoint_and_headers("meta")
 
     params = {
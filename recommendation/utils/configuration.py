@@ -21,6 +21,8 @@ class Settings(BaseSettings):
     CXSERVER_URL: AnyUrl = "https://cxserver.wikimedia.org"
     CXSERVER_HEADER: str | None = "cxserver.wikimedia.org"
     API_CONCURRENCY_LIMIT: int = 10
+    SEARCH_RESULTS_CACHE_SIZE: int = 256
+    SEARCH_RESULTS_CACHE_TTL: int = 60
     LANGUAGE_PAIRS_API_HEADER: str | None = None
     WIKIPEDIA_API: AnyUrl = "https://{source}.wikipedia.org/w/api.php"
     WIKIPEDIA_API_HEADER: str | None = "{source}.wikipedia.org"
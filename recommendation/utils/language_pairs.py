@@ -27,20 +27,21 @@ _language_to_domain_mapping = {
     "vro": "fiu-vro",
     "yue": "zh-yue",
 }
+_language_domains = frozenset(_language_to_domain_mapping.values())
 
 
 def is_valid_source_language(source):
     pairs = get_language_pairs()
     if pairs is None:
         return True
-    return source in pairs["source"] or source in get_language_to_domain_mapping().values()
+    return source in pairs["source"] or source in _language_domains
 
 
 def is_valid_target_language(target):
     pairs = get_language_pairs()
     if pairs is None:
         return True
-    return target in pairs["target"] or target in get_language_to_domain_mapping().values()
+    return target in pairs["target"] or target in _language_domains
 
 
 def initialize_language_pairs():
@@ -57,7 +58,8 @@ def initialize_language_pairs():
                 raise ValueError()
             if not all(isinstance(v, list) for v in pairs.values()):
                 raise ValueError()
-            _language_pairs = pairs
+            # Store the language codes as sets, as they are only used for membership tests
+            _language_pairs = {key: frozenset(codes) for key, codes in pairs.items()}
         except httpx.RequestError as e:
             log.warning(f"Unable to load data from {language_pairs_endpoint}. {e}")
         except (AttributeError, ValueError):
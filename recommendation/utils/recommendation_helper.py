@@ -1,3 +1,4 @@
+import heapq
 import random
 
 from recommendation.api.translation.models import (
@@ -5,10 +6,25 @@ from recommendation.api.translation.models import (
 )
 
 
-def sort_recommendations(recommendations, rank_method):
+def sort_recommendations(recommendations, rank_method, limit=None):
+    """
+    Orders recommendations according to the given rank method.
+
+    Args:
+        recommendations (list): The recommendations to order.
+        rank_method (RankMethodEnum): The rank method to order by.
+        limit (int): If given, only the first "limit" recommendations are selected, without sorting the full list.
+
+    Returns:
+        list: The ordered recommendations.
+    """
     if rank_method == RankMethodEnum.sitelinks:
         # Sort by langlinks count, from highest to lowest
+        if limit is not None:
+            return heapq.nlargest(limit, recommendations, key=lambda x: x.langlinks_count)
         return sorted(recommendations, key=lambda x: x.langlinks_count, reverse=True)
     else:
         # shuffle recommendations
+        if limit is not None:
+            return random.sample(recommendations, min(limit, len(recommendations)))
         return sorted(recommendations, key=lambda x: random.random())
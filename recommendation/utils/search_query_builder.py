@@ -0,0 +1,29 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1024)
+def build_search_query(topic: str | None, seed: str | None) -> str:
+    """
+    Builds the CirrusSearch "gsrsearch" expression for the given topic and seed.
+    The result only depends on its arguments, so it is memoized per process.
+
+    Args:
+        topic (str): Article topics, combined with "+", e.g. "Music+South Africa".
+        seed (str): Seed article title for "morelike" searches.
+
+    Returns:
+        str: The search expression, e.g. "articletopic:music+articletopic:south-africa morelikethis:Apple".
+    """
+    topic_expression = None
+    if topic:
+        topics = topic.replace(" ", "-").lower()
+        topic_expression = "+".join(f"articletopic:{topic_and_item.strip()}" for topic_and_item in topics.split("+"))
+
+    seed_expression = None
+    if seed:
+        # morelike is a "greedy" keyword, meaning that it cannot be combined with other search queries.
+        # To use other search queries, use morelikethis in your search:
+        # https://www.mediawiki.org/wiki/Help:CirrusSearch#morelike
+        seed_expression = f"morelikethis:{seed}" if topic_expression else f"morelike:{seed}"
+
+    return " ".join(filter(None, (topic_expression, seed_expression)))
@@ -1,7 +1,29 @@
+from typing import Dict
+
 from recommendation.cache import get_interwiki_map_cache, get_sitematrix_cache
 
+# Database names found by get_dbname_by_prefix. Each lookup scans the interwiki map and the sitematrix,
+# which are read from the disk cache. Only found names are kept, so a prefix missing from an outdated map
+# is looked up again. clear_dbname_cache is called when this process refreshes the maps, but a refresh by
+# another process (e.g. the update-cache script) does not clear the names cached here.
+_dbname_by_prefix: Dict[str, str] = {}
+
+
+def clear_dbname_cache():
+    _dbname_by_prefix.clear()
+
 
 def get_dbname_by_prefix(prefix) -> str | None:
+    dbname = _dbname_by_prefix.get(prefix)
+    if dbname is None:
+        dbname = find_dbname_by_prefix(prefix)
+        if dbname is not None:
+            _dbname_by_prefix[prefix] = dbname
+
+    return dbname
+
+
+def find_dbname_by_prefix(prefix) -> str | None:
     interwiki_map_cache = get_interwiki_map_cache()
     interwiki_map = interwiki_map_cache.get_interwiki_map()
 